@@ -2,8 +2,8 @@
 Configuration package for Auto Tweet Bot
 """
 
-from .twitter_config import TwitterConfig
+from .twitter_config import TwitterConfig, get_twitter_config
 from .schedule_config import ScheduleConfig
 
-__all__ = ['TwitterConfig', 'ScheduleConfig']
+__all__ = ['TwitterConfig', 'get_twitter_config', 'ScheduleConfig']
 __version__ = '1.0.0'
@@ -1,26 +1,56 @@
 import os
-from dotenv import load_dotenv
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import ClassVar, Dict, Optional
 
-load_dotenv()
+from dotenv import load_dotenv
 
+@dataclass(frozen=True)
 class TwitterConfig:
-    API_KEY = os.getenv('TWITTER_API_KEY')
-    API_SECRET = os.getenv('TWITTER_API_SECRET')
-    ACCESS_TOKEN = os.getenv('TWITTER_ACCESS_TOKEN')
-    ACCESS_SECRET = os.getenv('TWITTER_ACCESS_SECRET')
-    BEARER_TOKEN = os.getenv('TWITTER_BEARER_TOKEN')
+    __slots__ = ('api_key', 'api_secret', 'access_token', 'access_secret', 'bearer_token')
+    
+    api_key: Optional[str]
+    api_secret: Optional[str]
+    access_token: Optional[str]
+    access_secret: Optional[str]
+    bearer_token: Optional[str]
     
-    RATE_LIMIT = {
+    RATE_LIMIT: ClassVar[Dict[str, int]] = {
         'max_requests': 50,
         'per_minutes': 15
     }
     
-    @classmethod
-    def validate(cls):
-        required_vars = ['API_KEY', 'API_SECRET', 'ACCESS_TOKEN', 'ACCESS_SECRET']
-        missing = [var for var in required_vars if not getattr(cls, var)]
+    def __repr__(self):
+        # Every field is a credential; show only whether each one is set.
+        # A __repr__ defined here takes precedence over the generated one
+        fields = ', '.join(
+            f"{name}={'***' if getattr(self, name) else getattr(self, name)!r}"
+            for name in self.__slots__
+        )
+        return f"{type(self).__name__}({fields})"
+    
+    def validate(self):
+        required = (
+            ('API_KEY', self.api_key),
+            ('API_SECRET', self.api_secret),
+            ('ACCESS_TOKEN', self.access_token),
+            ('ACCESS_SECRET', self.access_secret)
+        )
+        missing = [name for name, value in required if not value]
         
         if missing:
             raise ValueError(f"Missing Twitter configuration: {', '.join(missing)}")
         
         return True
+
+@lru_cache(maxsize=1)
+def get_twitter_config() -> TwitterConfig:
+    """Load .env once and build the Twitter configuration from the environment"""
+    load_dotenv()
+    return TwitterConfig(
+        api_key=os.getenv('TWITTER_API_KEY'),
+        api_secret=os.getenv('TWITTER_API_SECRET'),
+        access_token=os.getenv('TWITTER_ACCESS_TOKEN'),
+        access_secret=os.getenv('TWITTER_ACCESS_SECRET'),
+        bearer_token=os.getenv('TWITTER_BEARER_TOKEN')
+    )
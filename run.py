@@ -8,18 +8,105 @@ from pathlib import Path
 project_root = Path(__file__).parent.absolute()
 sys.path.insert(0, str(project_root))
 
+# Sample data files, pre-serialized so first-run setup only has to write bytes
+_SAMPLE_CRYPTO_JSON = (
+    b'{\n'
+    b'  "topics": [\n'
+    b'    "Bitcoin",\n'
+    b'    "Ethereum",\n'
+    b'    "DeFi",\n'
+    b'    "NFTs",\n'
+    b'    "Web3"\n'
+    b'  ],\n'
+    b'  "templates": [\n'
+    b'    "Thoughts on {topic} in 2026? \\ud83e\\udd14 #Crypto"\n'
+    b'  ],\n'
+    b'  "hashtags": [\n'
+    b'    "#Crypto",\n'
+    b'    "#Bitcoin",\n'
+    b'    "#Ethereum"\n'
+    b'  ]\n'
+    b'}'
+)
+
+_SAMPLE_FINANCE_JSON = (
+    b'{\n'
+    b'  "quotes": [\n'
+    b'    {\n'
+    b'      "text": "The stock market is a device for transferring money from the impatient to the patient.",\n'
+    b'      "author": "Warren Buffett"\n'
+    b'    }\n'
+    b'  ],\n'
+    b'  "tips": [\n'
+    b'    "Start investing early. Even small amounts can grow significantly over time."\n'
+    b'  ],\n'
+    b'  "statistics": [\n'
+    b'    "If you invest $100 a month at 8% return for 40 years, you\'ll have over $310,000."\n'
+    b'  ]\n'
+    b'}'
+)
+
+_SAMPLE_JOKES_JSON = (
+    b'{\n'
+    b'  "programming": [\n'
+    b'    "Why do programmers prefer dark mode? Because light attracts bugs! \\ud83d\\udc1b"\n'
+    b'  ],\n'
+    b'  "crypto": [\n'
+    b'    "What\'s a cryptocurrency\'s favorite type of music? Block & roll!"\n'
+    b'  ]\n'
+    b'}'
+)
+
+_SAMPLE_SOCIAL_JSON = (
+    b'{\n'
+    b'  "topics": [\n'
+    b'    "The impact of social media on mental health"\n'
+    b'  ],\n'
+    b'  "questions": [\n'
+    b'    "How has social media changed the way we form relationships?"\n'
+    b'  ],\n'
+    b'  "insights": [\n'
+    b'    "Humans have a fundamental need for social connection, which technology can facilitate but not fully replace."\n'
+    b'  ]\n'
+    b'}'
+)
+
+_SAMPLE_DATA = (
+    ('crypto_topics.json', _SAMPLE_CRYPTO_JSON),
+    ('finance_quotes.json', _SAMPLE_FINANCE_JSON),
+    ('jokes.json', _SAMPLE_JOKES_JSON),
+    ('social_topics.json', _SAMPLE_SOCIAL_JSON)
+)
+
+def _list_dir(directory, listings):
+    """Return entry names of directory, scanning each directory only once"""
+    if directory not in listings:
+        try:
+            with os.scandir(directory) as entries:
+                listings[directory] = {entry.name for entry in entries}
+        except FileNotFoundError:
+            listings[directory] = set()
+    return listings[directory]
+
+def _path_exists(rel_path, listings):
+    """Check a project-relative path against the cached directory listings"""
+    path = project_root / rel_path
+    return path.name in _list_dir(path.parent, listings)
+
 def check_environment():
     """Check if all required environment and files exist"""
     print("🔍 Checking environment...")
     
+    # One scandir per parent directory instead of a stat per path
+    listings = {}
+    
     # Check Python version
     if sys.version_info < (3, 8):
         print("❌ Python 3.8 or higher required")
         return False
     
     # Check if .env exists
-    env_file = project_root / '.env'
-    if not env_file.exists():
+    if not _path_exists('.env', listings):
         print("❌ .env file not found")
         print("   Run: cp .env.example .env")
         print("   Then edit .env with your Twitter API keys")
@@ -33,9 +120,11 @@ def check_environment():
     ]
     
     for dir_path in required_dirs:
-        if not (project_root / dir_path).exists():
+        if not _path_exists(dir_path, listings):
             print(f"⚠️  Directory missing: {dir_path}")
-            (project_root / dir_path).mkdir(parents=True, exist_ok=True)
+            full_path = project_root / dir_path
+            full_path.mkdir(parents=True, exist_ok=True)
+            _list_dir(full_path.parent, listings).add(full_path.name)
             print(f"   Created: {dir_path}")
     
     # Check for data files
@@ -48,7 +137,7 @@ def check_environment():
     
     missing_files = []
     for file_path in data_files:
-        if not (project_root / file_path).exists():
+        if not _path_exists(file_path, listings):
             missing_files.append(file_path)
     
     if missing_files:
@@ -63,49 +152,20 @@ def check_environment():
 
 def create_sample_data():
     """Create sample data files if they don't exist"""
-    import json
-    
-    # Sample crypto data
-    crypto_data = {
-        "topics": ["Bitcoin", "Ethereum", "DeFi", "NFTs", "Web3"],
-        "templates": ["Thoughts on {topic} in 2026? 🤔 #Crypto"],
-        "hashtags": ["#Crypto", "#Bitcoin", "#Ethereum"]
-    }
-    
-    # Sample finance data
-    finance_data = {
-        "quotes": [
-            {"text": "The stock market is a device for transferring money from the impatient to the patient.", "author": "Warren Buffett"}
-        ],
-        "tips": ["Start investing early. Even small amounts can grow significantly over time."],
-        "statistics": ["If you invest $100 a month at 8% return for 40 years, you'll have over $310,000."]
-    }
-    
-    # Sample jokes data
-    jokes_data = {
-        "programming": ["Why do programmers prefer dark mode? Because light attracts bugs! 🐛"],
-        "crypto": ["What's a cryptocurrency's favorite type of music? Block & roll!"]
-    }
-    
-    # Sample social data
-    social_data = {
-        "topics": ["The impact of social media on mental health"],
-        "questions": ["How has social media changed the way we form relationships?"],
-        "insights": ["Humans have a fundamental need for social connection, which technology can facilitate but not fully replace."]
-    }
-    
-    data_to_create = {
-        'src/content/data/crypto_topics.json': crypto_data,
-        'src/content/data/finance_quotes.json': finance_data,
-        'src/content/data/jokes.json': jokes_data,
-        'src/content/data/social_topics.json': social_data
-    }
-    
-    for file_path, data in data_to_create.items():
-        full_path = project_root / file_path
-        with open(full_path, 'w') as f:
-            json.dump(data, f, indent=2)
-        print(f"   Created: {file_path}")
+    data_dir = project_root / 'src' / 'content' / 'data'
+    data_dir.mkdir(parents=True, exist_ok=True)
+    existing = _list_dir(data_dir, {})
+    
+    created = False
+    for filename, blob in _SAMPLE_DATA:
+        if filename in existing:
+            continue
+        (data_dir / filename).write_bytes(blob)
+        print(f"   Created: src/content/data/{filename}")
+        created = True
+    
+    if not created:
+        print("   All data files present")
 
 def show_banner():
     """Display ASCII art banner"""
@@ -150,6 +210,10 @@ Full documentation in: legal/ directory
 
 def setup_logging():
     """Setup logging configuration"""
+    # Load .env before the logger is configured, so LOG_LEVEL set there applies
+    from dotenv import load_dotenv
+    load_dotenv()
+    
     from src.core.logger import setup_logger
     return setup_logger('run')
 
@@ -192,6 +256,12 @@ Examples:
     # Show banner
     show_banner()
     
+    # Handle version request before any environment or logging setup
+    if args.version:
+        from src import __version__
+        print(f"Auto Tweet Bot Version: {__version__}")
+        sys.exit(0)
+    
     # Show disclaimer on first run
     show_disclaimer()
     
@@ -203,12 +273,6 @@ Examples:
     # Setup logging
     logger = setup_logging()
     
-    # Handle version request
-    if args.version:
-        from src import __version__
-        print(f"Auto Tweet Bot Version: {__version__}")
-        sys.exit(0)
-    
     # Handle setup wizard
     if args.setup:
         run_setup_wizard()
@@ -245,11 +309,9 @@ Examples:
             logger.info("Running single tweet mode...")
             bot.run_once()
         elif args.list_scheduled:
-            # We need to initialize scheduler but not start it
-            from src.core.scheduler import TweetScheduler
-            scheduler = TweetScheduler()
-            scheduler.schedule_tweets()
-            jobs = scheduler.get_scheduled_jobs()
+            # Only the generated times are listed; no jobs, content or API client needed
+            bot.scheduler.generate_random_schedule()
+            jobs = bot.scheduler.get_scheduled_jobs()
             
             print("\n📅 Scheduled Tweets:")
             print("="*60)
@@ -362,9 +424,9 @@ def test_twitter_connection():
     """Test Twitter API connection"""
     try:
         from src.core.twitter_client import TwitterClient
-        client = TwitterClient()
+        client = TwitterClient.instance()
         
-        user_info = client.get_user_info()
+        user_info = client.run(client.get_user_info())
         if user_info:
             print(f"✅ Connected to Twitter as: @{user_info['username']}")
             print(f"   Name: {user_info['name']}")
@@ -12,7 +12,13 @@ __description__ = 'Auto tweet bot for X.com with scheduled posting'
 __url__ = 'https://github.com/yourusername/auto-tweet-bot'
 __license__ = 'MIT'
 
-# Export main classes
-from .main import AutoTweetBot
-
 __all__ = ['AutoTweetBot']
+
+
+def __getattr__(name):
+    # Resolved lazily so that importing the package (e.g. for __version__)
+    # doesn't pull in tweepy, APScheduler and the .env file
+    if name == 'AutoTweetBot':
+        from .main import AutoTweetBot
+        return AutoTweetBot
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,13 @@
+"""
+Filesystem locations used across the bot, resolved once at import time
+"""
+
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+STORAGE_DIR = PROJECT_ROOT / 'storage'
+LOGS_DIR = STORAGE_DIR / 'logs'
+HISTORY_FILE = STORAGE_DIR / 'history.ndjson'
+# JSON-array history written by older versions, migrated into HISTORY_FILE
+LEGACY_HISTORY_FILE = STORAGE_DIR / 'history.json'
+DATA_DIR = PROJECT_ROOT / 'src' / 'content' / 'data'
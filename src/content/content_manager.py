@@ -1,49 +1,110 @@
-import json
+import bisect
+import itertools
 import random
+import re
 import logging
+from collections import deque
+from datetime import datetime
 from typing import Dict, Any, List, Optional
-from pathlib import Path
 
 from config.schedule_config import ScheduleConfig
+from src._paths import HISTORY_FILE
 from src.content.generators.crypto_generator import CryptoGenerator
 from src.content.generators.funny_generator import FunnyGenerator
 from src.content.generators.finance_generator import FinanceGenerator
 from src.content.generators.social_generator import SocialGenerator
+from src.utils import fastjson
+from src.utils.history_manager import migrate_legacy_history
 
 logger = logging.getLogger(__name__)
 
+_HASHTAG_RE = re.compile(r'#\w+')
+
+_CATEGORY_KEYWORDS = {
+    'crypto': ('crypto', 'bitcoin', 'ethereum', 'blockchain'),
+    'funny': ('joke', 'funny', 'humor', 'laugh'),
+    'finance': ('finance', 'invest', 'money', 'stock'),
+    'social': ('social', 'sociology', 'society', 'community'),
+}
+# One named group per category, each behind its own lazy scan from the
+# start, so an earlier category (crypto > funny > finance > social) wins
+# wherever its keyword appears, and lastgroup reports which one matched
+_CATEGORY_RE = re.compile(
+    '(?s)^(?:' + '|'.join(
+        f".*?(?P<{category}>{'|'.join(words)})"
+        for category, words in _CATEGORY_KEYWORDS.items()
+    ) + ')'
+)
+
 class ContentManager:
+    HISTORY_LIMIT = 100
+    COMPACT_THRESHOLD = 1000
+    
     def __init__(self):
+        # 'social' and 'sociology' share one generator instance
+        social_generator = SocialGenerator()
         self.generators = {
             'crypto': CryptoGenerator(),
             'funny': FunnyGenerator(),
             'finance': FinanceGenerator(),
-            'social': SocialGenerator(),
-            'sociology': SocialGenerator()  
+            'social': social_generator,
+            'sociology': social_generator
         }
         
-        self.history_file = Path(__file__).parent.parent.parent / 'storage' / 'history.json'
+        # Cumulative weights let generate_tweet sample with a single bisect
+        self._cats = tuple(ScheduleConfig.CATEGORIES.keys())
+        self._cum = list(itertools.accumulate(ScheduleConfig.CATEGORIES.values()))
+        
+        # Resolve the generator for each category up front; unknown
+        # categories fall back to crypto
+        for category in self._cats:
+            if category not in self.generators:
+                logger.warning(f"No generator for category '{category}', using crypto")
+        self._generator_by_index = tuple(
+            self.generators.get(category, self.generators['crypto'])
+            for category in self._cats
+        )
+        
+        # numpy state for generate_tweets, created on first batch request
+        self._batch_probs = None
+        self._batch_rng = None
+        
+        self.history_file = HISTORY_FILE
         self._ensure_history_file()
+        self._history_cache = deque(maxlen=self.HISTORY_LIMIT)
+        self._history_lines = 0
+        self._load_history()
     
     def _ensure_history_file(self):
         """Ensure history file exists"""
         self.history_file.parent.mkdir(parents=True, exist_ok=True)
-        if not self.history_file.exists():
-            with open(self.history_file, 'w') as f:
-                json.dump([], f)
+        self.history_file.touch(exist_ok=True)
+        migrate_legacy_history(self.history_file)
+    
+    def _load_history(self):
+        """Load the most recent history records into memory"""
+        try:
+            with open(self.history_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    self._history_lines += 1
+                    try:
+                        self._history_cache.append(fastjson.loads(line))
+                    except fastjson.JSONDecodeError:
+                        logger.warning("Skipping malformed history line")
+        except Exception as e:
+            logger.error(f"Failed to load tweet history: {str(e)}")
     
     def generate_tweet(self) -> str:
         """Generate a tweet with weighted random category selection"""
-        categories = list(ScheduleConfig.CATEGORIES.keys())
-        weights = list(ScheduleConfig.CATEGORIES.values())
+        r = random.random() * self._cum[-1]
+        idx = bisect.bisect_right(self._cum, r)
+        selected_category = self._cats[idx]
+        generator = self._generator_by_index[idx]
         
-        selected_category = random.choices(categories, weights=weights, k=1)[0]
-        
-        logger.info(f"Generating {selected_category} tweet...")
-        
-        generator = self.generators.get(selected_category)
-        if not generator:
-            generator = self.generators['crypto']
+        logger.info("Generating %s tweet...", selected_category)
         
         tweet_content = generator.generate()
         
@@ -51,14 +112,42 @@ class ContentManager:
         
         return tweet_content
     
+    def generate_tweets(self, n: int) -> List[str]:
+        """Generate a batch of tweets, sampling all categories in one call"""
+        if n <= 0:
+            return []
+        
+        import numpy as np
+        
+        if self._batch_probs is None:
+            probs = np.array(list(ScheduleConfig.CATEGORIES.values()), dtype=float)
+            self._batch_probs = probs / probs.sum()
+            self._batch_rng = np.random.default_rng()
+        
+        indices = self._batch_rng.choice(len(self._cats), size=n, p=self._batch_probs)
+        
+        logger.info(f"Generating batch of {n} tweets...")
+        
+        return [
+            self._trim_tweet(self._generator_by_index[idx].generate())
+            for idx in indices.tolist()
+        ]
+    
     def _trim_tweet(self, tweet: str, max_length: int = 280) -> str:
         """Trim tweet to fit within character limit"""
         if len(tweet) <= max_length:
             return tweet
         
-        import re
-        hashtags = re.findall(r'#\w+', tweet)
-        tweet_without_hashtags = re.sub(r'#\w+', '', tweet).strip()
+        # Collect hashtags and the text between them in a single scan
+        hashtags = []
+        text_parts = []
+        cursor = 0
+        for match in _HASHTAG_RE.finditer(tweet):
+            hashtags.append(match.group())
+            text_parts.append(tweet[cursor:match.start()])
+            cursor = match.end()
+        text_parts.append(tweet[cursor:])
+        tweet_without_hashtags = ''.join(text_parts).strip()
         
         hashtags_text = ' '.join(hashtags) if hashtags else ''
         
@@ -76,9 +165,6 @@ class ContentManager:
     def record_tweet(self, tweet_id: str, content: str):
         """Record tweet in history"""
         try:
-            with open(self.history_file, 'r') as f:
-                history = json.load(f)
-            
             tweet_record = {
                 'id': tweet_id,
                 'content': content,
@@ -86,40 +172,41 @@ class ContentManager:
                 'category': self._detect_category(content)
             }
             
-            history.append(tweet_record)
+            self._history_cache.append(tweet_record)
             
-            if len(history) > 100:
-                history = history[-100:]
+            with open(self.history_file, 'a', encoding='utf-8') as f:
+                f.write(fastjson.dumps(tweet_record) + '\n')
+            self._history_lines += 1
             
-            with open(self.history_file, 'w') as f:
-                json.dump(history, f, indent=2)
+            if self._history_lines > self.COMPACT_THRESHOLD:
+                self._compact()
             
-            logger.info(f"Tweet recorded: {tweet_id}")
+            logger.info("Tweet recorded: %s", tweet_id)
             
         except Exception as e:
-            logger.error(f"Failed to record tweet: {str(e)}")
+            logger.error("Failed to record tweet: %s", e)
+    
+    def _compact(self):
+        """Rewrite the history file keeping only the in-memory records"""
+        tmp_file = self.history_file.with_suffix('.ndjson.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.writelines(fastjson.dumps(record) + '\n' for record in self._history_cache)
+        tmp_file.replace(self.history_file)
+        self._history_lines = len(self._history_cache)
+        logger.debug("Compacted tweet history to %s records", self._history_lines)
     
     def _detect_category(self, content: str) -> str:
         """Detect category from content"""
-        content_lower = content.lower()
-        
-        if any(word in content_lower for word in ['crypto', 'bitcoin', 'ethereum', 'blockchain']):
-            return 'crypto'
-        elif any(word in content_lower for word in ['joke', 'funny', 'humor', 'laugh']):
-            return 'funny'
-        elif any(word in content_lower for word in ['finance', 'invest', 'money', 'stock']):
-            return 'finance'
-        elif any(word in content_lower for word in ['social', 'sociology', 'society', 'community']):
-            return 'social'
+        # Lowercase like the substring checks this replaced; IGNORECASE
+        # would also match a few non-ASCII letters that lower() doesn't map
+        match = _CATEGORY_RE.match(content.lower())
+        if match:
+            return match.lastgroup
         
         return 'general'
     
     def get_tweet_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get tweet history"""
-        try:
-            with open(self.history_file, 'r') as f:
-                history = json.load(f)
-            return history[-limit:]
-        except Exception as e:
-            logger.error(f"Failed to get tweet history: {str(e)}")
-            return []
+        # Slice the tail of the ring buffer without copying all of it first
+        size = len(self._history_cache)
+        return list(itertools.islice(self._history_cache, max(0, size - limit), size))
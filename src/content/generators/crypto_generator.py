@@ -1,29 +1,42 @@
-import json
 import random
-from pathlib import Path
-from typing import List
+import re
+from typing import List, Tuple
+
+from src._paths import DATA_DIR
+from .data_loader import load_data
+
+_DATA_FILE = str(DATA_DIR / 'crypto_topics.json')
+
+_SLOT_RE = re.compile(r'\{(topic|hashtag)\}')
 
 class CryptoGenerator:
     def __init__(self):
-        data_file = Path(__file__).parent.parent / 'data' / 'crypto_topics.json'
-        with open(data_file, 'r') as f:
-            self.data = json.load(f)
+        self.data = load_data(_DATA_FILE)
+        self._topics = tuple(self.data['topics'])
+        self._templates = tuple(self._compile_template(t) for t in self.data['templates'])
+        self._hashtags = tuple(self.data['hashtags'])
     
     def generate(self) -> str:
         """Generate a crypto-related tweet"""
-        topic = random.choice(self.data['topics'])
-        template = random.choice(self.data['templates'])
-        hashtag = random.choice(self.data['hashtags'])
+        topic = random.choice(self._topics)
+        hashtag = random.choice(self._hashtags)
         
-        tweet = template.replace('{topic}', topic).replace('{hashtag}', hashtag)
+        # Odd positions of a compiled template hold slot names
+        parts = list(random.choice(self._templates))
+        values = {'topic': topic, 'hashtag': hashtag}
+        parts[1::2] = [values[slot] for slot in parts[1::2]]
+        tweet = ''.join(parts)
         
         additional_hashtags = self._get_random_hashtags(3)
         tweet += ' ' + ' '.join(additional_hashtags)
         
         return tweet.strip()
     
+    @staticmethod
+    def _compile_template(template: str) -> Tuple[str, ...]:
+        """Split a template into alternating literal text and slot names"""
+        return tuple(_SLOT_RE.split(template))
+    
     def _get_random_hashtags(self, count: int = 3) -> List[str]:
         """Get random hashtags"""
-        hashtags = self.data['hashtags'].copy()
-        random.shuffle(hashtags)
-        return hashtags[:min(count, len(hashtags))]
+        return random.sample(self._hashtags, k=min(count, len(self._hashtags)))
@@ -0,0 +1,11 @@
+from functools import lru_cache
+from typing import Any, Dict
+
+from src.utils.fastjson import loads
+
+
+@lru_cache(maxsize=None)
+def load_data(path: str) -> Dict[str, Any]:
+    """Load a generator data file, parsing it at most once per process"""
+    with open(path, 'rb') as f:
+        return loads(f.read())
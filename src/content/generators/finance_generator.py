@@ -1,26 +1,30 @@
-import json
 import random
-from pathlib import Path
 from typing import Dict, List
 
+from src._paths import DATA_DIR
+from .data_loader import load_data
+
+_DATA_FILE = str(DATA_DIR / 'finance_quotes.json')
+
 class FinanceGenerator:
     def __init__(self):
-        data_file = Path(__file__).parent.parent / 'data' / 'finance_quotes.json'
-        with open(data_file, 'r') as f:
-            self.data = json.load(f)
+        self.data = load_data(_DATA_FILE)
+        self._quotes = tuple(self.data['quotes'])
+        self._tips = tuple(self.data['tips'])
+        self._statistics = tuple(self.data['statistics'])
     
     def generate(self) -> str:
         """Generate a finance-related tweet"""
         rand_val = random.random()
         
         if rand_val < 0.4:
-            quote = random.choice(self.data['quotes'])
+            quote = random.choice(self._quotes)
             return f"\"{quote['text']}\" — {quote['author']}\n\n#Finance #Investing #Money"
         
         elif rand_val < 0.7:
-            tip = random.choice(self.data['tips'])
+            tip = random.choice(self._tips)
             return f"💰 Financial Tip: {tip}\n\n#FinancialFreedom #MoneyTips #PersonalFinance"
         
         else:
-            stat = random.choice(self.data['statistics'])
+            stat = random.choice(self._statistics)
             return f"📊 Did you know? {stat}\n\n#FinanceFacts #Economics #Investing"
@@ -1,13 +1,16 @@
-import json
 import random
-from pathlib import Path
 from typing import Dict, List
 
+from src._paths import DATA_DIR
+from .data_loader import load_data
+
+_DATA_FILE = str(DATA_DIR / 'jokes.json')
+
 class FunnyGenerator:
     def __init__(self):
-        data_file = Path(__file__).parent.parent / 'data' / 'jokes.json'
-        with open(data_file, 'r') as f:
-            self.jokes = json.load(f)
+        self.jokes = load_data(_DATA_FILE)
+        self._categories = tuple(self.jokes)
+        self._jokes = {category: tuple(jokes) for category, jokes in self.jokes.items()}
         
         self.hashtag_map = {
             'programming': ['#Programming', '#TechJokes', '#DeveloperHumor', '#Coding'],
@@ -18,13 +21,11 @@ class FunnyGenerator:
     
     def generate(self) -> str:
         """Generate a funny tweet"""
-        categories = list(self.jokes.keys())
-        category = random.choice(categories)
+        category = random.choice(self._categories)
         
-        joke = random.choice(self.jokes[category])
+        joke = random.choice(self._jokes[category])
         
         hashtags = self.hashtag_map.get(category, ['#Funny', '#Humor'])
-        random.shuffle(hashtags)
-        selected_hashtags = hashtags[:random.randint(1, 3)]
+        selected_hashtags = random.sample(hashtags, k=random.randint(1, min(3, len(hashtags))))
         
         return f"{joke}\n\n{' '.join(selected_hashtags)}"
@@ -1,34 +1,38 @@
-import json
 import random
-from pathlib import Path
 from typing import List
 
+from src._paths import DATA_DIR
+from .data_loader import load_data
+
+_DATA_FILE = str(DATA_DIR / 'social_topics.json')
+
 class SocialGenerator:
     def __init__(self):
-        data_file = Path(__file__).parent.parent / 'data' / 'social_topics.json'
-        with open(data_file, 'r') as f:
-            self.data = json.load(f)
+        self.data = load_data(_DATA_FILE)
+        self._topics = tuple(self.data['topics'])
+        self._questions = tuple(self.data['questions'])
+        self._insights = tuple(self.data['insights'])
         
-        self.discussion_starters = [
+        self.discussion_starters = (
             "What's the most positive change you've seen in social media lately?",
             "How has technology changed the way we form communities?",
             "What's one social norm you wish would change?",
             "How do you balance online and offline social interactions?",
             "What role should social media play in society?",
             "How can we build better online communities?"
-        ]
+        )
     
     def generate(self) -> str:
         """Generate a social/sociology tweet"""
         rand_val = random.random()
         
         if rand_val < 0.3:
-            topic = random.choice(self.data['topics'])
-            question = random.choice(self.data['questions'])
+            topic = random.choice(self._topics)
+            question = random.choice(self._questions)
             return f"{topic}\n\n{question}\n\n#SocialMedia #Society #Discussion"
         
         elif rand_val < 0.6:
-            insight = random.choice(self.data['insights'])
+            insight = random.choice(self._insights)
             return f"🧠 Social Insight: {insight}\n\n#Sociology #HumanBehavior #Psychology"
         
         else:
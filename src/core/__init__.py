@@ -2,8 +2,8 @@
 Core module for Auto Tweet Bot
 """
 
-from .twitter_client import TwitterClient
-from .scheduler import TweetScheduler
+import importlib
+
 from .logger import logger, setup_logger
 
 __all__ = [
@@ -12,3 +12,18 @@ __all__ = [
     'logger',
     'setup_logger'
 ]
+
+# Heavy submodules (tweepy, APScheduler) are only imported on first use
+_LAZY_EXPORTS = {
+    'TwitterClient': '.twitter_client',
+    'TweetScheduler': '.scheduler'
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,23 +1,24 @@
 import logging
+import logging.handlers
+import os
 import sys
-from pathlib import Path
-from datetime import datetime
 
-def setup_logger(name: str = None, log_level: str = None):
-    """Setup logger with file and console handlers"""
-    
-    logger = logging.getLogger(name or __name__)
-    
-    if log_level is None:
-        from dotenv import load_dotenv
-        import os
-        load_dotenv()
-        log_level = os.getenv('LOG_LEVEL', 'INFO')
-    
-    logger.setLevel(getattr(logging, log_level))
+from src._paths import LOGS_DIR
+
+# All project loggers live under this name; third-party loggers (tweepy,
+# urllib3, apscheduler) stay on the untouched root logger, so their request
+# debugging - Authorization headers included - never reaches app.log
+PROJECT_LOGGER = 'src'
+
+def _configure_project_logger():
+    """Attach the process-wide file and console handlers to the project logger"""
+    # Read from the environment only; entry points load .env before
+    # importing the logger, so importing the package never parses it
+    log_level = os.environ.get('LOG_LEVEL', 'INFO')
     
-    if logger.handlers:
-        return logger
+    project = logging.getLogger(PROJECT_LOGGER)
+    project.setLevel(getattr(logging, log_level))
+    project.propagate = False
     
     file_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -26,11 +27,16 @@ def setup_logger(name: str = None, log_level: str = None):
         '%(levelname)s - %(message)s'
     )
     
-    logs_dir = Path(__file__).parent.parent.parent / 'storage' / 'logs'
-    logs_dir.mkdir(parents=True, exist_ok=True)
+    if not LOGS_DIR.exists():
+        LOGS_DIR.mkdir(parents=True, exist_ok=True)
     
-    log_file = logs_dir / f'app_{datetime.now().strftime("%Y%m%d")}.log'
-    file_handler = logging.FileHandler(log_file)
+    # One handle for the whole process, rolled over to app.log.YYYY-MM-DD at midnight
+    file_handler = logging.handlers.TimedRotatingFileHandler(
+        LOGS_DIR / 'app.log',
+        when='midnight',
+        backupCount=30,
+        utc=True
+    )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(file_formatter)
     
@@ -38,9 +44,24 @@ def setup_logger(name: str = None, log_level: str = None):
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(console_formatter)
     
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    project.addHandler(file_handler)
+    project.addHandler(console_handler)
+
+def setup_logger(name: str = None, log_level: str = None):
+    """Get a logger that propagates to the shared project handlers"""
+    
+    name = name or __name__
+    if name != PROJECT_LOGGER and not name.startswith(PROJECT_LOGGER + '.'):
+        name = f'{PROJECT_LOGGER}.{name}'
+    
+    logger = logging.getLogger(name)
+    logger.propagate = True
+    
+    if log_level is not None:
+        logger.setLevel(getattr(logging, log_level))
     
     return logger
 
+_configure_project_logger()
+
 logger = setup_logger()
@@ -1,42 +1,68 @@
+import os
 import time
 import random
-import logging
-from datetime import datetime
+import asyncio
 from typing import List, Dict, Any
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 import pytz
 
 from config.schedule_config import ScheduleConfig
-from src.content.content_manager import ContentManager
-from src.core.twitter_client import TwitterClient
 from src.core.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Resolved once; the timezone is fixed for the life of the process
+_TZ = pytz.timezone(ScheduleConfig.TIMEZONE)
+
 class TweetScheduler:
     def __init__(self):
-        self.scheduler = BackgroundScheduler(timezone=pytz.timezone(ScheduleConfig.TIMEZONE))
-        self.content_manager = ContentManager()
-        self.twitter_client = TwitterClient()
+        self.scheduler = AsyncIOScheduler(timezone=_TZ)
+        # Content and the API client are only needed once tweets are posted,
+        # so listing a schedule never loads data files or credentials
+        self._content_manager = None
+        self._twitter_client = None
         self.scheduled_times = []  # Store our scheduled times
         self.is_running = False
+        self._loop = None
+        # Fixed for the process; run.py sets it before the scheduler is built
+        self.dry_run = os.getenv('DRY_RUN', 'False').lower() == 'true'
+    
+    @property
+    def content_manager(self):
+        """Content manager, created on first use"""
+        if self._content_manager is None:
+            from src.content.content_manager import ContentManager
+            self._content_manager = ContentManager()
+        return self._content_manager
+    
+    @property
+    def twitter_client(self):
+        """Shared Twitter client, created on first use"""
+        if self._twitter_client is None:
+            from src.core.twitter_client import TwitterClient
+            self._twitter_client = TwitterClient.instance()
+        return self._twitter_client
     
     def generate_random_schedule(self) -> List[Dict[str, Any]]:
         """Generate random schedule for tweets"""
         config = ScheduleConfig.SCHEDULE
         schedules = []
         
-        for _ in range(config['count']):
-            # Random day (0-6 = Monday-Sunday for APScheduler)
-            random_day = random.choice(config['days'])
-            
-            # Random time within range
-            start_hour = config['time_range']['start'].hour
-            end_hour = config['time_range']['end'].hour
-            
-            random_hour = random.randint(start_hour, end_hour - 1)
-            random_minute = random.randint(0, 59)
+        # Days are 0-6 = Monday-Sunday for APScheduler
+        days = config['days']
+        start_hour = config['time_range']['start'].hour
+        end_hour = config['time_range']['end'].hour
+        slots_per_day = (end_hour - start_hour) * 60
+        
+        # Draw distinct (day, hour, minute) slots in one batch; each index
+        # decodes to a slot, so the product is never materialized
+        total_slots = len(days) * slots_per_day
+        for slot in random.sample(range(total_slots), k=min(config['count'], total_slots)):
+            day_index, minute_of_window = divmod(slot, slots_per_day)
+            random_day = days[day_index]
+            random_hour = start_hour + minute_of_window // 60
+            random_minute = minute_of_window % 60
             
             schedules.append({
                 'day_of_week': str(random_day),  # APScheduler expects string for cron
@@ -65,7 +91,7 @@ class TweetScheduler:
                 day_of_week=schedule_info['day_of_week'],
                 hour=schedule_info['hour'],
                 minute=schedule_info['minute'],
-                timezone=pytz.timezone(ScheduleConfig.TIMEZONE)
+                timezone=_TZ
             )
             
             # Add job to scheduler
@@ -82,7 +108,7 @@ class TweetScheduler:
                 scheduled = self.scheduled_times[i]
                 logger.info(f"Scheduled tweet {i+1} for {scheduled['day']} at {scheduled['time']}")
     
-    def post_scheduled_tweet(self):
+    async def post_scheduled_tweet(self):
         """Execute scheduled tweet"""
         try:
             logger.info("🎯 Executing scheduled tweet...")
@@ -90,12 +116,8 @@ class TweetScheduler:
             # Generate content
             tweet_content = self.content_manager.generate_tweet()
             
-            # Check if dry run
-            import os
-            dry_run = os.getenv('DRY_RUN', 'False').lower() == 'true'
-            
-            if dry_run:
-                logger.info(f"📝 DRY RUN - Would have tweeted: {tweet_content}")
+            if self.dry_run:
+                logger.info("📝 DRY RUN - Would have tweeted: %s", tweet_content)
                 result = {
                     'success': True,
                     'dry_run': True,
@@ -103,8 +125,8 @@ class TweetScheduler:
                 }
             else:
                 # Post tweet
-                logger.info(f"📤 Posting tweet: {tweet_content[:80]}...")
-                result = self.twitter_client.tweet(tweet_content)
+                logger.info("📤 Posting tweet: %s...", tweet_content[:80])
+                result = await self.twitter_client.tweet(tweet_content)
             
             if result.get('success'):
                 # Record tweet in history
@@ -112,12 +134,12 @@ class TweetScheduler:
                 self.content_manager.record_tweet(tweet_id, tweet_content)
                 logger.info("✅ Tweet processed successfully")
             else:
-                logger.error(f"❌ Failed to process tweet: {result.get('error')}")
+                logger.error("❌ Failed to process tweet: %s", result.get('error'))
             
             return result
             
         except Exception as e:
-            logger.error(f"🔥 Error in scheduled tweet: {str(e)}", exc_info=True)
+            logger.error("🔥 Error in scheduled tweet: %s", e, exc_info=True)
             return {'success': False, 'error': str(e)}
     
     def start(self):
@@ -128,8 +150,9 @@ class TweetScheduler:
             # Schedule tweets
             self.schedule_tweets()
             
-            # Start the scheduler
-            self.scheduler.start()
+            # The scheduler starts once the event loop is running
+            self._loop = asyncio.new_event_loop()
+            self._loop.call_soon(self.scheduler.start)
             self.is_running = True
             
             # Log all scheduled times
@@ -140,19 +163,28 @@ class TweetScheduler:
             logger.info("✅ Tweet scheduler started successfully!")
             logger.info("🤖 Bot is now running. Press Ctrl+C to stop.")
             
-            # Keep the script running
+            # The event loop sleeps until the next job is due
             try:
-                while True:
-                    time.sleep(1)
+                self._loop.run_forever()
             except (KeyboardInterrupt, SystemExit):
                 self.stop()
+            finally:
+                if self._twitter_client is not None:
+                    self._loop.run_until_complete(self._twitter_client.close())
+                self._loop.close()
     
     def stop(self):
         """Stop the scheduler"""
         if self.is_running:
             logger.info("🛑 Stopping tweet scheduler...")
-            self.scheduler.shutdown(wait=False)
             self.is_running = False
+            if self.scheduler.running:
+                self.scheduler.shutdown(wait=False)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            # After Ctrl+C the loop is no longer running; spin it once so the
+            # queued shutdown callbacks actually execute
+            if not self._loop.is_running():
+                self._loop.run_forever()
             logger.info("✅ Tweet scheduler stopped")
     
     def get_scheduled_jobs(self) -> List[Dict[str, Any]]:
@@ -164,6 +196,7 @@ class TweetScheduler:
                 'name': f'Scheduled Tweet {i}',
                 'day': scheduled['day'],
                 'time': scheduled['time'],
-                'next_run': f"Every {scheduled['day']} at {scheduled['time']}"
+                'next_run': f"Every {scheduled['day']} at {scheduled['time']}",
+                'trigger': f"cron[day_of_week='{scheduled['day']}', time='{scheduled['time']}']"
             })
         return jobs
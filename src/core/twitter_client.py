@@ -1,61 +1,109 @@
+import asyncio
+import functools
+import threading
+import aiohttp
 import tweepy
 import logging
+from tweepy.asynchronous import AsyncClient
 from typing import Optional, Dict, Any
-from config.twitter_config import TwitterConfig
+from config.twitter_config import get_twitter_config
 
 logger = logging.getLogger(__name__)
 
 class TwitterClient:
     _instance = None
+    _lock = threading.Lock()
     
     def __new__(cls):
+        # TwitterClient() is the older spelling and returns the shared client
+        return cls.instance()
+    
+    @classmethod
+    def instance(cls) -> 'TwitterClient':
+        """Return the shared client, creating it on first use"""
         if cls._instance is None:
-            cls._instance = super(TwitterClient, cls).__new__(cls)
-            cls._instance._initialize()
+            with cls._lock:
+                if cls._instance is None:
+                    # Publish only a fully initialized client, so a failed
+                    # _initialize leaves nothing half-built behind
+                    client = super().__new__(cls)
+                    client._initialize()
+                    cls._instance = client
         return cls._instance
     
     def _initialize(self):
         """Initialize Twitter client"""
-        TwitterConfig.validate()
+        config = get_twitter_config()
+        config.validate()
         
         self.auth = tweepy.OAuth1UserHandler(
-            TwitterConfig.API_KEY,
-            TwitterConfig.API_SECRET,
-            TwitterConfig.ACCESS_TOKEN,
-            TwitterConfig.ACCESS_SECRET
+            config.api_key,
+            config.api_secret,
+            config.access_token,
+            config.access_secret
         )
         
-        self.client = tweepy.Client(
-            bearer_token=TwitterConfig.BEARER_TOKEN,
-            consumer_key=TwitterConfig.API_KEY,
-            consumer_secret=TwitterConfig.API_SECRET,
-            access_token=TwitterConfig.ACCESS_TOKEN,
-            access_token_secret=TwitterConfig.ACCESS_SECRET,
+        self.client = AsyncClient(
+            bearer_token=config.bearer_token,
+            consumer_key=config.api_key,
+            consumer_secret=config.api_secret,
+            access_token=config.access_token,
+            access_token_secret=config.access_secret,
             wait_on_rate_limit=True
         )
         
         self.api_v1 = tweepy.API(self.auth)
+        self._session_loop = None
         
         logger.info("Twitter client initialized")
     
-    def tweet(self, content: str, **kwargs) -> Dict[str, Any]:
+    def _ensure_session(self):
+        """Give the API client one keep-alive session for the running event loop"""
+        # Without a session tweepy opens (and TLS-handshakes) a new one per request
+        loop = asyncio.get_running_loop()
+        session = self.client.session
+        if session is None or session.closed or self._session_loop is not loop:
+            self.client.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=75)
+            )
+            self._session_loop = loop
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        session = self.client.session
+        self.client.session = None
+        self._session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+    
+    def run(self, coro):
+        """Run a client coroutine on a fresh event loop and close the session afterwards"""
+        async def runner():
+            try:
+                return await coro
+            finally:
+                await self.close()
+        return asyncio.run(runner())
+    
+    async def tweet(self, content: str, **kwargs) -> Dict[str, Any]:
         """Post a tweet"""
         try:
-            logger.info(f"Posting tweet: {content[:50]}...")
+            logger.info("Posting tweet: %s...", content[:50])
             
             if kwargs.get('dry_run', False):
-                logger.info(f"DRY RUN: Would have tweeted: {content}")
+                logger.info("DRY RUN: Would have tweeted: %s", content)
                 return {
                     'success': True,
                     'dry_run': True,
                     'text': content
                 }
             
-            response = self.client.create_tweet(text=content)
+            self._ensure_session()
+            response = await self.client.create_tweet(text=content)
             
             if response.data:
                 tweet_id = response.data['id']
-                logger.info(f"Tweet posted successfully: {tweet_id}")
+                logger.info("Tweet posted successfully: %s", tweet_id)
                 
                 return {
                     'success': True,
@@ -66,45 +114,52 @@ class TwitterClient:
                 raise Exception("No response data from Twitter API")
                 
         except tweepy.TweepyException as e:
-            logger.error(f"Failed to post tweet: {str(e)}")
+            logger.error("Failed to post tweet: %s", e)
             return {
                 'success': False,
                 'error': str(e)
             }
         except Exception as e:
-            logger.error(f"Unexpected error posting tweet: {str(e)}")
+            logger.error("Unexpected error posting tweet: %s", e)
             return {
                 'success': False,
                 'error': str(e)
             }
     
-    def upload_media(self, file_path: str, media_type: str = 'image/jpeg') -> Optional[str]:
+    async def upload_media(self, file_path: str, media_type: str = 'image/jpeg') -> Optional[str]:
         """Upload media to Twitter"""
         try:
-            media = self.api_v1.media_upload(filename=file_path)
-            logger.info(f"Media uploaded: {media.media_id}")
+            # Media upload is only available on the synchronous v1.1 API,
+            # so run it in a worker thread to keep the event loop free
+            loop = asyncio.get_running_loop()
+            media = await loop.run_in_executor(
+                None, functools.partial(self.api_v1.media_upload, filename=file_path)
+            )
+            logger.info("Media uploaded: %s", media.media_id)
             return media.media_id
         except Exception as e:
-            logger.error(f"Failed to upload media: {str(e)}")
+            logger.error("Failed to upload media: %s", e)
             return None
     
-    def get_tweet(self, tweet_id: str) -> Optional[Dict[str, Any]]:
+    async def get_tweet(self, tweet_id: str) -> Optional[Dict[str, Any]]:
         """Get tweet details"""
         try:
-            tweet = self.client.get_tweet(
+            self._ensure_session()
+            tweet = await self.client.get_tweet(
                 tweet_id,
                 tweet_fields=['created_at', 'public_metrics']
             )
             return tweet.data
         except Exception as e:
-            logger.error(f"Failed to get tweet: {str(e)}")
+            logger.error("Failed to get tweet: %s", e)
             return None
     
-    def get_user_info(self) -> Optional[Dict[str, Any]]:
+    async def get_user_info(self) -> Optional[Dict[str, Any]]:
         """Get authenticated user info"""
         try:
-            user = self.client.get_me(user_fields=['public_metrics'])
+            self._ensure_session()
+            user = await self.client.get_me(user_fields=['public_metrics'])
             return user.data
         except Exception as e:
-            logger.error(f"Failed to get user info: {str(e)}")
+            logger.error("Failed to get user info: %s", e)
             return None
@@ -9,16 +9,19 @@ load_dotenv()
 
 from src.core.logger import setup_logger
 from src.core.scheduler import TweetScheduler
-from src.core.twitter_client import TwitterClient
 
 logger = setup_logger(__name__)
 
 class AutoTweetBot:
     def __init__(self):
         self.scheduler = TweetScheduler()
-        self.twitter_client = TwitterClient()
         self.is_running = False
     
+    @property
+    def twitter_client(self):
+        """Shared Twitter client, created on first use"""
+        return self.scheduler.twitter_client
+    
     def start(self):
         """Start the bot"""
         try:
@@ -57,7 +60,7 @@ class AutoTweetBot:
     def _test_twitter_connection(self):
         """Test Twitter API connection"""
         try:
-            user_info = self.twitter_client.get_user_info()
+            user_info = self.twitter_client.run(self.twitter_client.get_user_info())
             if user_info:
                 logger.info(f"✅ Connected to Twitter as: @{user_info['username']}")
                 logger.info(f"   User ID: {user_info['id']}")
@@ -89,7 +92,7 @@ class AutoTweetBot:
             print(f"{'='*50}\n")
             
             if input("Post this tweet? (y/N): ").lower() == 'y':
-                result = self.twitter_client.tweet(tweet_content)
+                result = self.twitter_client.run(self.twitter_client.tweet(tweet_content))
                 if result.get('success'):
                     logger.info("✅ Tweet posted successfully!")
                     content_manager.record_tweet(result.get('tweet_id'), tweet_content)
@@ -116,9 +119,9 @@ def main():
         if args.once:
             bot.run_once()
         elif args.list_scheduled:
-            scheduler = TweetScheduler()
-            scheduler.schedule_tweets()
-            jobs = scheduler.get_scheduled_jobs()
+            # Only the generated times are listed; no jobs, content or API client needed
+            bot.scheduler.generate_random_schedule()
+            jobs = bot.scheduler.get_scheduled_jobs()
             
             print("\n📅 Scheduled Tweets:")
             print("="*50)
@@ -13,6 +13,7 @@ from .helpers import (
 
 from .validators import (
     validate_tweet_content,
+    validate_tweet_quick,
     validate_environment,
     validate_schedule,
     validate_hashtags,
@@ -30,6 +31,7 @@ __all__ = [
     
     # Validators
     'validate_tweet_content',
+    'validate_tweet_quick',
     'validate_environment',
     'validate_schedule',
     'validate_hashtags',
@@ -2,42 +2,70 @@ import random
 import string
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
-import json
+
+from src.utils import fastjson
+
+_DEFAULT_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+_ALPHANUMERIC = string.ascii_letters + string.digits
+
+def _has_default_layout(date_str: str) -> bool:
+    """Whether date_str is exactly 'YYYY-MM-DD HH:MM:SS' with ASCII digits"""
+    return (len(date_str) == 19 and date_str.isascii()
+            and date_str[4] == '-' and date_str[7] == '-' and date_str[10] == ' '
+            and date_str[13] == ':' and date_str[16] == ':'
+            and (date_str[:4] + date_str[5:7] + date_str[8:10]
+                 + date_str[11:13] + date_str[14:16] + date_str[17:]).isdigit())
 
 def generate_random_string(length: int = 8) -> str:
     """Generate random string"""
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+    return ''.join(random.choices(_ALPHANUMERIC, k=length))
 
-def weighted_random_choice(items: List[Any], weights: List[float]) -> Any:
-    """Weighted random choice"""
-    if len(items) != len(weights):
+def weighted_random_choice(items: List[Any], weights: Optional[List[float]] = None,
+                           cum_weights: Optional[List[float]] = None) -> Any:
+    """Weighted random choice; pass cum_weights to reuse a precomputed prefix sum"""
+    given = cum_weights if weights is None else weights
+    if given is None:
+        raise ValueError("Either weights or cum_weights must be given")
+    # Accept any iterable, e.g. itertools.accumulate(weights) for cum_weights
+    if not isinstance(given, (list, tuple)):
+        given = list(given)
+    if len(items) != len(given):
         raise ValueError("Items and weights must have same length")
     
-    total = sum(weights)
-    r = random.uniform(0, total)
+    # random.choices refuses a zero total; all-zero weights pick the first item
+    total = sum(given) if weights is not None else (given[-1] if given else 0)
+    if items and total == 0:
+        return items[0]
     
-    cumulative = 0
-    for item, weight in zip(items, weights):
-        cumulative += weight
-        if r <= cumulative:
-            return item
-    
-    return items[-1]
+    if weights is not None:
+        return random.choices(items, weights=given)[0]
+    return random.choices(items, cum_weights=given)[0]
 
 def safe_json_load(filepath: str, default: Any = None) -> Any:
     """Safely load JSON file"""
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        return fastjson.load_file(filepath)
+    except (FileNotFoundError, fastjson.JSONDecodeError):
         return default if default is not None else {}
 
-def format_datetime(dt: datetime, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
+def format_datetime(dt: datetime, format_str: str = _DEFAULT_DATETIME_FORMAT) -> str:
     """Format datetime to string"""
+    # isoformat renders the default layout in C; it adds an offset for
+    # aware datetimes and pads years below 1000, so those go through strftime
+    if format_str == _DEFAULT_DATETIME_FORMAT and dt.tzinfo is None and dt.year >= 1000:
+        return dt.isoformat(sep=' ', timespec='seconds')
     return dt.strftime(format_str)
 
-def parse_datetime(date_str: str, format_str: str = "%Y-%m-%d %H:%M:%S") -> Optional[datetime]:
+def parse_datetime(date_str: str, format_str: str = _DEFAULT_DATETIME_FORMAT) -> Optional[datetime]:
     """Parse string to datetime"""
+    # fromisoformat skips strptime's regex for the exact default layout;
+    # anything else (e.g. unpadded fields) still goes through strptime
+    if format_str == _DEFAULT_DATETIME_FORMAT and _has_default_layout(date_str):
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    
     try:
         return datetime.strptime(date_str, format_str)
     except ValueError:
@@ -2,105 +2,285 @@
 History manager for tweet history operations
 """
 
-import json
+import bisect
+import itertools
+import os
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Deque, List, Dict, Optional
+from src._paths import HISTORY_FILE, LEGACY_HISTORY_FILE
 from src.core.logger import setup_logger
+from src.utils import fastjson
 
 logger = setup_logger(__name__)
 
+def _parse_timestamp(value) -> Optional[float]:
+    """Parse an ISO timestamp into epoch seconds, or None if it can't be parsed"""
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except (ValueError, AttributeError):
+        return None
+
+def _copies(tweets) -> List[Dict]:
+    """Shallow-copy cached tweets, so callers can't change the cache or its indexes"""
+    return [dict(tweet) for tweet in tweets]
+
+def migrate_legacy_history(history_file: Path = HISTORY_FILE,
+                           legacy_file: Path = LEGACY_HISTORY_FILE) -> int:
+    """Fold a legacy JSON-array history into the NDJSON store, returning the number of tweets moved"""
+    if not legacy_file.exists():
+        return 0
+    
+    try:
+        records = fastjson.load_file(legacy_file)
+    except (OSError, fastjson.JSONDecodeError) as e:
+        logger.warning(f"Could not read legacy history {legacy_file}: {str(e)}")
+        return 0
+    if not isinstance(records, list):
+        logger.warning(f"Legacy history {legacy_file} is not a list, leaving it in place")
+        return 0
+    
+    # Legacy tweets are older than anything already in the NDJSON file
+    existing = history_file.read_text(encoding='utf-8') if history_file.exists() else ''
+    if existing and not existing.endswith('\n'):
+        existing += '\n'
+    
+    history_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = history_file.with_name(history_file.name + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.writelines(fastjson.dumps(record) + '\n' for record in records)
+        f.write(existing)
+    os.replace(tmp_file, history_file)
+    
+    # Keep the old file as a backup, renamed so it is not migrated twice
+    legacy_file.replace(legacy_file.with_name(legacy_file.name + '.migrated'))
+    logger.info(f"Migrated {len(records)} tweets from {legacy_file} to {history_file}")
+    return len(records)
+
 class HistoryManager:
+    MAX_HISTORY = 1000
+    
     def __init__(self, history_file: str = None):
         if history_file is None:
-            self.history_file = Path(__file__).parent.parent.parent / 'storage' / 'history.json'
+            # Same NDJSON store ContentManager.record_tweet appends to
+            self.history_file = HISTORY_FILE
+            migrate_legacy_history(self.history_file)
         else:
             self.history_file = Path(history_file)
         
         self._ensure_history_file()
+        
+        # Parsed history, kept until the file changes on disk
+        self._history: Deque[Dict] = deque(maxlen=self.MAX_HISTORY)
+        # First tweet recorded under each id, as a front-to-back scan would find
+        self._id_index: Dict[str, Dict] = {}
+        self._duplicate_ids = set()
+        self._category_index: Dict[Optional[str], List[Dict]] = {}
+        # Dated tweets sorted by epoch timestamp, built on first date query
+        self._date_keys: Optional[List[float]] = None
+        self._date_tweets: Optional[List[Dict]] = None
+        # Whether the date index lists tweets in history order too
+        self._date_in_order = True
+        self._file_stamp = None
+        self._current()
     
     def _ensure_history_file(self):
         """Ensure history file exists"""
         self.history_file.parent.mkdir(parents=True, exist_ok=True)
         if not self.history_file.exists():
-            with open(self.history_file, 'w') as f:
-                json.dump([], f)
+            self.history_file.touch()
             logger.info(f"Created history file: {self.history_file}")
     
     def add_tweet(self, tweet_data: Dict):
         """Add a tweet to history"""
         try:
-            history = self.load_history()
-            history.append(tweet_data)
+            history = self._current()
+            # Cache a copy; later changes to the caller's dict don't touch history
+            tweet_data = dict(tweet_data)
             
-            # Keep only last 1000 tweets
-            if len(history) > 1000:
-                history = history[-1000:]
+            # The deque keeps only the last MAX_HISTORY tweets; drop the
+            # oldest one from the indexes before append evicts it
+            if len(history) == history.maxlen:
+                self._unindex_tweet(history[0])
+            history.append(tweet_data)
+            self._index_tweet(tweet_data)
             
             self.save_history(history)
-            logger.debug(f"Added tweet to history: {tweet_data.get('id', 'unknown')}")
+            logger.debug("Added tweet to history: %s", tweet_data.get('id', 'unknown'))
             return True
         except Exception as e:
-            logger.error(f"Failed to add tweet to history: {str(e)}")
+            logger.error("Failed to add tweet to history: %s", e)
             return False
     
+    def _stat_history_file(self):
+        """Return an (mtime, size) stamp for the history file, or None if missing"""
+        try:
+            stat = self.history_file.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _current(self) -> Deque[Dict]:
+        """Return the cached history, re-reading the file only if it changed"""
+        stamp = self._stat_history_file()
+        if stamp is not None and stamp == self._file_stamp:
+            return self._history
+        
+        history = []
+        try:
+            with open(self.history_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        history.append(fastjson.loads(line))
+                    except fastjson.JSONDecodeError:
+                        logger.warning("Skipping malformed history line")
+        except FileNotFoundError:
+            pass
+        
+        self._history = deque(history, maxlen=self.MAX_HISTORY)
+        self._file_stamp = stamp
+        self._reindex()
+        return self._history
+    
+    def _reindex(self):
+        """Rebuild lookup indexes from the cached history"""
+        self._id_index = {}
+        self._duplicate_ids = set()
+        self._category_index = {}
+        self._date_keys = self._date_tweets = None
+        for tweet in self._history:
+            self._index_tweet(tweet)
+    
+    def _date_index(self):
+        """Return the sorted (timestamps, tweets) index, building it if needed"""
+        if self._date_keys is None:
+            dated = []
+            for tweet in self._history:
+                ts = _parse_timestamp(tweet.get('timestamp'))
+                if ts is not None:
+                    dated.append((ts, tweet))
+            self._date_in_order = all(a[0] <= b[0] for a, b in zip(dated, dated[1:]))
+            if not self._date_in_order:
+                dated.sort(key=lambda pair: pair[0])
+            self._date_keys = [ts for ts, _ in dated]
+            self._date_tweets = [tweet for _, tweet in dated]
+        return self._date_keys, self._date_tweets
+    
+    def _index_tweet(self, tweet: Dict):
+        """Add a single tweet to the lookup indexes"""
+        tweet_id = tweet.get('id')
+        if tweet_id is not None:
+            if tweet_id in self._id_index:
+                self._duplicate_ids.add(tweet_id)
+            else:
+                self._id_index[tweet_id] = tweet
+        
+        self._category_index.setdefault(tweet.get('category'), []).append(tweet)
+        
+        if self._date_keys is not None:
+            ts = _parse_timestamp(tweet.get('timestamp'))
+            if ts is not None:
+                i = bisect.bisect_right(self._date_keys, ts)
+                if i != len(self._date_keys):
+                    self._date_in_order = False
+                self._date_keys.insert(i, ts)
+                self._date_tweets.insert(i, tweet)
+    
+    def _unindex_tweet(self, tweet: Dict):
+        """Remove a single tweet from the lookup indexes"""
+        tweet_id = tweet.get('id')
+        if self._id_index.get(tweet_id) is tweet:
+            del self._id_index[tweet_id]
+            if tweet_id in self._duplicate_ids:
+                # Fall back to the next oldest tweet with the same id
+                for candidate in self._history:
+                    if candidate is not tweet and candidate.get('id') == tweet_id:
+                        self._id_index[tweet_id] = candidate
+                        break
+        
+        by_category = self._category_index.get(tweet.get('category'))
+        if by_category:
+            # The evicted tweet is normally the oldest in its category
+            if by_category[0] is tweet:
+                del by_category[0]
+            else:
+                for i, candidate in enumerate(by_category):
+                    if candidate is tweet:
+                        del by_category[i]
+                        break
+        
+        if self._date_tweets is not None:
+            # The evicted tweet is normally the oldest; otherwise rebuild lazily
+            if self._date_tweets and self._date_tweets[0] is tweet:
+                del self._date_keys[0]
+                del self._date_tweets[0]
+            elif _parse_timestamp(tweet.get('timestamp')) is not None:
+                self._date_keys = self._date_tweets = None
+    
     def load_history(self) -> List[Dict]:
         """Load tweet history"""
-        try:
-            with open(self.history_file, 'r') as f:
-                history = json.load(f)
-            return history
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+        return _copies(self._current())
     
     def save_history(self, history: List[Dict]):
         """Save tweet history"""
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(history, f, indent=2)
+            # Write to a sibling temp file and swap it in, so a crash
+            # mid-write never leaves a truncated history behind
+            tmp_file = self.history_file.with_name(self.history_file.name + '.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.writelines(fastjson.dumps(tweet) + '\n' for tweet in history)
+            os.replace(tmp_file, self.history_file)
+            
+            if history is not self._history:
+                self._history = deque(_copies(history), maxlen=self.MAX_HISTORY)
+                self._reindex()
+            self._file_stamp = self._stat_history_file()
         except Exception as e:
-            logger.error(f"Failed to save history: {str(e)}")
+            logger.error("Failed to save history: %s", e)
     
     def get_tweet_by_id(self, tweet_id: str) -> Optional[Dict]:
         """Get tweet by ID"""
-        history = self.load_history()
-        for tweet in history:
-            if tweet.get('id') == tweet_id:
-                return tweet
-        return None
+        self._current()
+        tweet = self._id_index.get(tweet_id)
+        return dict(tweet) if tweet is not None else None
     
     def get_recent_tweets(self, limit: int = 10) -> List[Dict]:
         """Get most recent tweets"""
-        history = self.load_history()
-        return history[-limit:] if history else []
+        history = self._current()
+        if limit <= 0:
+            # Same as history[-limit:]: 0 returns everything, -n drops the oldest n
+            return _copies(list(history)[-limit:])
+        return _copies(itertools.islice(history, max(0, len(history) - limit), None))
     
     def get_tweets_by_category(self, category: str, limit: int = 20) -> List[Dict]:
         """Get tweets by category"""
-        history = self.load_history()
-        filtered = [t for t in history if t.get('category') == category]
-        return filtered[-limit:] if filtered else []
+        self._current()
+        filtered = self._category_index.get(category)
+        return _copies(filtered[-limit:]) if filtered else []
     
     def get_tweets_by_date(self, start_date: datetime, end_date: datetime = None) -> List[Dict]:
         """Get tweets within date range"""
         if end_date is None:
             end_date = datetime.now()
         
-        history = self.load_history()
-        filtered = []
-        
-        for tweet in history:
-            try:
-                tweet_date = datetime.fromisoformat(tweet.get('timestamp').replace('Z', '+00:00'))
-                if start_date <= tweet_date <= end_date:
-                    filtered.append(tweet)
-            except (ValueError, AttributeError):
-                continue
+        history = self._current()
+        keys, tweets = self._date_index()
+        lo = bisect.bisect_left(keys, start_date.timestamp())
+        hi = bisect.bisect_right(keys, end_date.timestamp())
+        if self._date_in_order:
+            return _copies(tweets[lo:hi])
         
-        return filtered
+        # Timestamps are out of history order; return the hits in history order
+        matched = {id(tweet) for tweet in tweets[lo:hi]}
+        return [dict(tweet) for tweet in history if id(tweet) in matched]
     
     def get_statistics(self) -> Dict:
         """Get statistics from history"""
-        history = self.load_history()
+        history = self._current()
         
         if not history:
             return {
@@ -114,21 +294,18 @@ class HistoryManager:
             }
         
         total = len(history)
-        successful = sum(1 for t in history if t.get('success'))
-        failed = total - successful
-        
-        # Calculate impressions and engagements
-        total_impressions = sum(t.get('impressions', 0) for t in history)
-        total_engagements = sum(
-            t.get('likes', 0) + t.get('retweets', 0) + t.get('replies', 0) 
-            for t in history
-        )
-        
-        # Category distribution
+        successful = total_impressions = total_engagements = 0
         categories = {}
+        
+        # Success count, impressions, engagements and category distribution in one pass
         for tweet in history:
+            if tweet.get('success'):
+                successful += 1
+            total_impressions += tweet.get('impressions', 0)
+            total_engagements += tweet.get('likes', 0) + tweet.get('retweets', 0) + tweet.get('replies', 0)
             cat = tweet.get('category', 'unknown')
             categories[cat] = categories.get(cat, 0) + 1
+        failed = total - successful
         
         return {
             'total_tweets': total,
@@ -146,30 +323,23 @@ class HistoryManager:
         """Remove tweets older than specified days"""
         cutoff_date = datetime.now() - timedelta(days=days_to_keep)
         
-        history = self.load_history()
-        initial_count = len(history)
-        
-        filtered = []
-        for tweet in history:
-            try:
-                tweet_date = datetime.fromisoformat(tweet.get('timestamp').replace('Z', '+00:00'))
-                if tweet_date >= cutoff_date:
-                    filtered.append(tweet)
-            except (ValueError, AttributeError):
-                # Keep if we can't parse date
-                filtered.append(tweet)
+        history = self._current()
+        keys, tweets = self._date_index()
         
-        self.save_history(filtered)
-        removed = initial_count - len(filtered)
+        # Everything before the cutoff in the sorted index goes; tweets
+        # without a parseable date are never in the index, so they are kept
+        expired = {id(tweet) for tweet in tweets[:bisect.bisect_left(keys, cutoff_date.timestamp())]}
+        removed = len(expired)
         
         if removed > 0:
+            self.save_history([t for t in history if id(t) not in expired])
             logger.info(f"Cleaned up {removed} tweets older than {days_to_keep} days")
         
         return removed
     
     def export_history(self, export_format: str = 'json', filepath: str = None) -> bool:
         """Export history to file"""
-        history = self.load_history()
+        history = self._current()
         
         if not filepath:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -177,15 +347,18 @@ class HistoryManager:
         
         try:
             if export_format.lower() == 'json':
-                with open(filepath, 'w') as f:
-                    json.dump(history, f, indent=2)
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    f.write(fastjson.dumps(list(history), indent=True))
             elif export_format.lower() == 'csv':
                 import csv
-                with open(filepath, 'w', newline='') as f:
+                with open(filepath, 'w', newline='', encoding='utf-8') as f:
                     if history:
-                        writer = csv.DictWriter(f, fieldnames=history[0].keys())
-                        writer.writeheader()
-                        writer.writerows(history)
+                        # Union of keys in first-seen order, so fields that only
+                        # appear in later tweets still get a column
+                        fields = list(dict.fromkeys(key for tweet in history for key in tweet))
+                        writer = csv.writer(f)
+                        writer.writerow(fields)
+                        writer.writerows([tweet.get(key, '') for key in fields] for tweet in history)
             else:
                 logger.error(f"Unsupported export format: {export_format}")
                 return False
@@ -5,18 +5,120 @@ Validates environment variables, tweet content, and configurations
 
 import os
 import re
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime, time
-import json
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple, Optional
+from datetime import time
 
 from src.core.logger import setup_logger
 
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasick not available, blocked words use the regex matcher
+    ahocorasick = None
+
 logger = setup_logger(__name__)
 
+# Patterns used on every validated tweet, compiled once at import
+_HASHTAG_RE = re.compile(r'#(\w+)')
+_MENTION_RE = re.compile(r'@(\w+)')
+_URL_RE = re.compile(r'https?://\S+|www\.\S+')
+# APScheduler day_of_week values, Monday-Sunday
+_VALID_DAYS = frozenset(range(7))
+
+# Hashtags, mentions and URLs in one alternation, for single-pass tokenizing
+_TOKEN_RE = re.compile(r'(?P<tag>#\w+)|(?P<mention>@\w+)|(?P<url>https?://\S+|www\.\S+)')
+_WORD_CHAR_RE = re.compile(r'\w')
+# Hashtags, mentions and URLs that is_all_caps strips before counting words
+_CAPS_STRIP_RE = re.compile(r'[@#]\w+|https?://\S+')
+
+
+# Environment variables validate_environment depends on
+_REQUIRED_ENV_VARS = (
+    'TWITTER_API_KEY',
+    'TWITTER_API_SECRET',
+    'TWITTER_ACCESS_TOKEN',
+    'TWITTER_ACCESS_SECRET'
+)
+_RECOMMENDED_ENV_VARS = ('TWITTER_BEARER_TOKEN',)
+_ENV_SNAPSHOT_VARS = _REQUIRED_ENV_VARS + _RECOMMENDED_ENV_VARS + ('TWEETS_PER_WEEK', 'TIMEZONE', 'DRY_RUN')
+
+
+@lru_cache(maxsize=1)
+def _known_timezones() -> Optional[frozenset]:
+    """Set of known timezone names, or None if no timezone database is available"""
+    # Prefer the stdlib database (3.9+); it is empty on systems without tzdata
+    try:
+        from zoneinfo import available_timezones
+        timezones = available_timezones()
+    except ImportError:
+        timezones = None
+    if timezones:
+        return frozenset(timezones)
+    
+    try:
+        import pytz
+    except ImportError:
+        return None
+    return frozenset(pytz.all_timezones)
+
+
+def _copy_results(results: Dict[str, any]) -> Dict[str, any]:
+    """Copy a cached results dict, with fresh lists so callers can't mutate the cache"""
+    return {key: list(value) if isinstance(value, list) else value for key, value in results.items()}
+
+
+def _parse_hh_mm(value: str) -> time:
+    """Parse like datetime.strptime(value, '%H:%M').time(), without strptime's regex"""
+    hours, sep, minutes = value.partition(':')
+    # strptime only takes ASCII digits; isdigit() alone also passes e.g. '\u0663'
+    if (sep and 1 <= len(hours) <= 2 and 1 <= len(minutes) <= 2 and value.isascii()
+            and hours.isdigit() and minutes.isdigit()):
+        hour, minute = int(hours), int(minutes)
+        if hour < 24 and minute < 60:
+            return time(hour, minute)
+    raise ValueError(f"time data {value!r} does not match format '%H:%M'")
+
+
+def _path_state(path: str, listings: Dict[str, Optional[Dict[str, os.DirEntry]]]) -> Tuple[bool, bool]:
+    """Return (exists, is_dir) for path from its parent's listing, scanning each parent only once"""
+    parent, name = os.path.split(path)
+    if parent not in listings:
+        try:
+            with os.scandir(parent) as entries:
+                listings[parent] = {entry.name: entry for entry in entries}
+        except FileNotFoundError:
+            listings[parent] = {}
+        except OSError:
+            # The parent is not a directory, or can be searched but not read;
+            # stat the path itself instead, as os.path.exists/isdir would
+            listings[parent] = None
+    
+    listing = listings[parent]
+    if listing is None:
+        return os.path.exists(path), os.path.isdir(path)
+    
+    entry = listing.get(name)
+    if entry is None:
+        return False, False
+    try:
+        return True, entry.is_dir()
+    except OSError:
+        return True, False
+
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    """Whether a regex \\b would match in text just before index"""
+    before = index > 0 and _WORD_CHAR_RE.match(text, index - 1) is not None
+    after = index < len(text) and _WORD_CHAR_RE.match(text, index) is not None
+    return before != after
+
 
 class ContentValidator:
     """Validates tweet content for safety and compliance"""
     
+    __slots__ = ('blocked_words', '_blocked_lower', '_blocked_re', '_blocked_prefixes', '_blocked_automaton')
+    
     # Common blocked words/phrases (can be loaded from file)
     DEFAULT_BLOCKED_WORDS = [
         'hate', 'kill', 'murder', 'terrorist', 'bomb',
@@ -26,10 +128,10 @@ class ContentValidator:
     ]
     
     # Twitter reserved words/characters
-    RESERVED_HASHTAGS = [
+    RESERVED_HASHTAGS = frozenset({
         'twitter', 'admin', 'support', 'help',
         'api', 'oauth', 'security'
-    ]
+    })
     
     def __init__(self, blocked_words_file: Optional[str] = None):
         self.blocked_words = self.DEFAULT_BLOCKED_WORDS.copy()
@@ -42,6 +144,71 @@ class ContentValidator:
                     self.blocked_words.extend(additional_words)
             except Exception as e:
                 logger.warning(f"Failed to load blocked words file: {str(e)}")
+        
+        self._update_blocked_re()
+    
+    def add_blocked_words(self, words: List[str]):
+        """
+        Extend the blocked word list and rebuild the matcher
+        
+        Args:
+            words: Additional words or phrases to block
+        """
+        self.blocked_words.extend(words)
+        self._update_blocked_re()
+    
+    def _update_blocked_re(self):
+        """Build the blocked word matcher: an Aho-Corasick automaton if available, else a regex"""
+        self._blocked_lower = tuple(word.lower() for word in self.blocked_words)
+        words = sorted(set(self._blocked_lower), key=len, reverse=True)
+        self._blocked_automaton = None
+        self._blocked_prefixes = {}
+        
+        if words and ahocorasick is not None:
+            # A single automaton pass beats the alternation on long word lists
+            automaton = ahocorasick.Automaton()
+            for word in words:
+                automaton.add_word(word, word)
+            automaton.make_automaton()
+            self._blocked_automaton = automaton
+            self._blocked_re = None
+        elif words:
+            # The lookahead tries every position, so 'scam' is still found
+            # inside a blocked phrase like 'crypto scam'. It reports only the
+            # longest word at each start; shorter words starting there are
+            # prefixes of it, so map each word to its blocked prefixes to
+            # report every hit the automaton would
+            self._blocked_re = re.compile(
+                r'(?=\b(' + '|'.join(re.escape(word) for word in words) + r')\b)'
+            )
+            word_set = set(words)
+            for word in words:
+                prefixes = tuple(word[:i] for i in range(len(word) - 1, 0, -1) if word[:i] in word_set)
+                if prefixes:
+                    self._blocked_prefixes[word] = prefixes
+        else:
+            self._blocked_re = None
+    
+    def _iter_blocked(self, content_lower: str) -> Iterator[str]:
+        """Yield lowercased blocked words as they are found in content_lower"""
+        if self._blocked_automaton is not None:
+            for end, word in self._blocked_automaton.iter(content_lower):
+                # The automaton matches substrings; keep only whole-word hits
+                start = end - len(word) + 1
+                if _is_word_boundary(content_lower, start) and _is_word_boundary(content_lower, end + 1):
+                    yield word
+        elif self._blocked_re is not None:
+            for match in self._blocked_re.finditer(content_lower):
+                word = match.group(1)
+                yield word
+                start = match.start()
+                for prefix in self._blocked_prefixes.get(word, ()):
+                    if _is_word_boundary(content_lower, start + len(prefix)):
+                        yield prefix
+    
+    def _find_blocked(self, content_lower: str) -> set:
+        """Return the set of lowercased blocked words present in content_lower"""
+        return set(self._iter_blocked(content_lower))
     
     def validate_tweet_content(self, content: str, max_length: int = 280) -> Dict[str, any]:
         """
@@ -76,42 +243,50 @@ class ContentValidator:
                 f"Contains inappropriate content: {', '.join(profane_check['found_words'])}"
             )
         
+        # Cheap substring tests first; most tweets need no tokenizing at all
+        # when none of the token markers appear
+        if '#' in content or '@' in content or 'http' in content or 'www.' in content:
+            hashtags, mentions, urls = self._tokenize(content)
+        else:
+            hashtags, mentions, urls = [], [], []
+        
         # Check for excessive hashtags (Twitter recommends max 2-3)
-        hashtags = self.extract_hashtags(content)
         if len(hashtags) > 5:
             validation_results['warnings'].append(
                 f"Too many hashtags ({len(hashtags)}). Twitter recommends 2-3 hashtags max."
             )
         
         # Check for reserved hashtags
-        reserved_used = [ht for ht in hashtags if ht.lower() in self.RESERVED_HASHTAGS]
+        hashtags_lower = [ht.lower() for ht in hashtags]
+        reserved_used = [
+            ht for ht, lowered in zip(hashtags, hashtags_lower)
+            if lowered in self.RESERVED_HASHTAGS
+        ]
         if reserved_used:
             validation_results['warnings'].append(
                 f"Using reserved hashtags: {', '.join(reserved_used)}"
             )
         
         # Check for excessive mentions
-        mentions = self.extract_mentions(content)
         if len(mentions) > 3:
             validation_results['warnings'].append(
                 f"Too many mentions ({len(mentions)}). This may trigger spam filters."
             )
         
         # Check for URLs
-        urls = self.extract_urls(content)
         if len(urls) > 2:
             validation_results['warnings'].append(
                 f"Multiple URLs ({len(urls)}) may reduce engagement."
             )
         
-        # Check for repetitive characters
-        if self.has_repetitive_characters(content):
+        # Check for repetitive characters (a run of 4 needs at least 4 chars)
+        if len(content) > 3 and self.has_repetitive_characters(content):
             validation_results['warnings'].append(
                 "Contains repetitive characters that may trigger spam filters"
             )
         
-        # Check for all caps
-        if self.is_all_caps(content):
+        # Check for all caps (an all-lowercase tweet has no caps words)
+        if not content.islower() and self.is_all_caps(content):
             validation_results['warnings'].append(
                 "Excessive use of ALL CAPS may be seen as shouting"
             )
@@ -129,6 +304,24 @@ class ContentValidator:
         
         return validation_results
     
+    def validate_tweet_quick(self, content: str, max_length: int = 280) -> bool:
+        """
+        Check only whether content would pass validation
+        
+        Runs just the checks that can make validate_tweet_content report an
+        error, stopping at the first blocked word, and builds no report.
+        
+        Args:
+            content: Tweet content to validate
+            max_length: Maximum allowed tweet length
+            
+        Returns:
+            True if validate_tweet_content would mark the content valid
+        """
+        if len(content) > max_length:
+            return False
+        return next(self._iter_blocked(content.lower()), None) is None
+    
     def is_profane_content(self, content: str) -> Dict[str, any]:
         """
         Check if content contains profanity or blocked words
@@ -139,14 +332,15 @@ class ContentValidator:
         Returns:
             Dict with results
         """
-        content_lower = content.lower()
         found_words = []
         
-        for word in self.blocked_words:
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(word.lower()) + r'\b'
-            if re.search(pattern, content_lower):
-                found_words.append(word)
+        # One scan over the lowercased text; word boundaries avoid partial matches
+        matched = self._find_blocked(content.lower())
+        if matched:
+            found_words = [
+                word for word, lowered in zip(self.blocked_words, self._blocked_lower)
+                if lowered in matched
+            ]
         
         return {
             'has_profane': len(found_words) > 0,
@@ -154,32 +348,70 @@ class ContentValidator:
             'blocked_word_count': len(found_words)
         }
     
+    def _tokenize(self, content: str) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Split out hashtags, mentions and URLs in a single scan
+        
+        Args:
+            content: Text to tokenize
+            
+        Returns:
+            Tuple of (hashtags, mentions, urls); hashtags and mentions
+            without their leading '#'/'@', as the extract_* methods return them
+        """
+        hashtags, mentions, urls = [], [], []
+        for match in _TOKEN_RE.finditer(content):
+            kind = match.lastgroup
+            if kind == 'tag':
+                hashtags.append(match.group()[1:])
+            elif kind == 'mention':
+                mentions.append(match.group()[1:])
+            else:
+                urls.append(match.group())
+        return hashtags, mentions, urls
+    
     def extract_hashtags(self, content: str) -> List[str]:
         """Extract hashtags from content"""
-        hashtags = re.findall(r'#(\w+)', content)
+        hashtags = _HASHTAG_RE.findall(content)
         return hashtags
     
     def extract_mentions(self, content: str) -> List[str]:
         """Extract mentions from content"""
-        mentions = re.findall(r'@(\w+)', content)
+        mentions = _MENTION_RE.findall(content)
         return mentions
     
     def extract_urls(self, content: str) -> List[str]:
         """Extract URLs from content"""
-        url_pattern = r'https?://\S+|www\.\S+'
-        urls = re.findall(url_pattern, content)
+        urls = _URL_RE.findall(content)
         return urls
     
     def has_repetitive_characters(self, content: str, threshold: int = 3) -> bool:
         """Check for repetitive characters (e.g., '!!!!!', '????')"""
-        pattern = r'(.)\1{' + str(threshold) + ',}'
-        return bool(re.search(pattern, content))
+        # Run-length scan; like the regex '(.)\\1{n,}' it ignores newline runs
+        run = 0
+        prev = None
+        for char in content:
+            if char == prev:
+                run += 1
+            else:
+                prev = char
+                run = 1
+            if run > threshold and char != '\n':
+                return True
+        return False
     
     def is_all_caps(self, content: str, ratio_threshold: float = 0.7) -> bool:
         """Check if text is mostly all caps"""
-        # Remove hashtags, mentions, and URLs for this check
-        text_only = re.sub(r'[@#]\w+|https?://\S+', '', content)
-        words = text_only.split()
+        # Remove hashtags, mentions, and URLs for this check. Matches never
+        # span whitespace, so stripping each token gives the same words as
+        # stripping the whole text, and most tokens need no regex at all
+        words = []
+        for word in content.split():
+            if '@' in word or '#' in word or '://' in word:
+                word = _CAPS_STRIP_RE.sub('', word)
+                if not word:
+                    continue
+            words.append(word)
         
         if not words:
             return False
@@ -217,8 +449,8 @@ class ContentValidator:
                 results['is_valid'] = False
                 continue
             
-            # Check characters (only alphanumeric and underscores)
-            if not re.match(r'^[A-Za-z0-9_]+$', tag):
+            # Check characters (only ASCII alphanumeric and underscores)
+            if not (tag.isascii() and tag.replace('_', 'a').isalnum()):
                 results['errors'].append(f"Invalid characters in hashtag: #{tag}")
                 results['is_valid'] = False
                 continue
@@ -239,6 +471,8 @@ class ContentValidator:
 class EnvironmentValidator:
     """Validates environment variables and configuration"""
     
+    __slots__ = ()
+    
     @staticmethod
     def validate_environment() -> Dict[str, any]:
         """
@@ -247,6 +481,29 @@ class EnvironmentValidator:
         Returns:
             Dict with validation results
         """
+        snapshot = tuple(os.getenv(var) for var in _ENV_SNAPSHOT_VARS)
+        results = EnvironmentValidator._validate_environment_snapshot(snapshot)
+        
+        return _copy_results(results)
+    
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _validate_environment_snapshot(snapshot: Tuple[Optional[str], ...]) -> Dict[str, any]:
+        """
+        Validate a snapshot of the environment, memoized while it is unchanged
+        
+        Args:
+            snapshot: Values of _ENV_SNAPSHOT_VARS, in order
+            
+        Returns:
+            Dict with validation results
+        """
+        env = dict(zip(_ENV_SNAPSHOT_VARS, snapshot))
+        
+        def getenv(var: str, default: Optional[str] = None) -> Optional[str]:
+            value = env[var]
+            return default if value is None else value
+        
         results = {
             'is_valid': True,
             'errors': [],
@@ -255,20 +512,9 @@ class EnvironmentValidator:
             'invalid_vars': []
         }
         
-        # Required variables
-        required_vars = [
-            'TWITTER_API_KEY',
-            'TWITTER_API_SECRET',
-            'TWITTER_ACCESS_TOKEN',
-            'TWITTER_ACCESS_SECRET'
-        ]
-        
-        # Recommended variables
-        recommended_vars = ['TWITTER_BEARER_TOKEN']
-        
         # Check required variables
-        for var in required_vars:
-            value = os.getenv(var)
+        for var in _REQUIRED_ENV_VARS:
+            value = getenv(var)
             if not value:
                 results['missing_vars'].append(var)
                 results['is_valid'] = False
@@ -277,12 +523,12 @@ class EnvironmentValidator:
                 results['is_valid'] = False
         
         # Check recommended variables
-        for var in recommended_vars:
-            if not os.getenv(var):
+        for var in _RECOMMENDED_ENV_VARS:
+            if not getenv(var):
                 results['warnings'].append(f"Recommended variable missing: {var}")
         
         # Check numeric variables
-        tweets_per_week = os.getenv('TWEETS_PER_WEEK', '2')
+        tweets_per_week = getenv('TWEETS_PER_WEEK', '2')
         try:
             tweets = int(tweets_per_week)
             if tweets < 1 or tweets > 50:
@@ -293,17 +539,14 @@ class EnvironmentValidator:
             results['is_valid'] = False
         
         # Check timezone
-        timezone = os.getenv('TIMEZONE', 'UTC')
-        try:
-            import pytz
-            if timezone not in pytz.all_timezones:
-                results['warnings'].append(f"Timezone '{timezone}' may not be valid")
-        except ImportError:
-            # pytz not available, skip validation
-            pass
+        timezone = getenv('TIMEZONE', 'UTC')
+        known_timezones = _known_timezones()
+        # Skip validation if neither zoneinfo nor pytz has a timezone database
+        if known_timezones is not None and timezone not in known_timezones:
+            results['warnings'].append(f"Timezone '{timezone}' may not be valid")
         
         # Check dry run
-        dry_run = os.getenv('DRY_RUN', 'False')
+        dry_run = getenv('DRY_RUN', 'False')
         if dry_run.lower() not in ['true', 'false', 'yes', 'no', '0', '1']:
             results['warnings'].append('DRY_RUN should be True or False')
         
@@ -348,20 +591,27 @@ class EnvironmentValidator:
             './src/content/data/social_topics.json'
         ]
         
+        # One scandir per parent directory instead of a stat per path
+        listings = {}
+        
         # Check directories
         for directory in required_dirs:
-            if not os.path.exists(directory):
+            exists, is_dir = _path_state(directory, listings)
+            if not exists:
                 try:
                     os.makedirs(directory, exist_ok=True)
+                    # The parent's cached listing no longer reflects the disk
+                    listings.pop(os.path.dirname(directory), None)
                     logger.info(f"Created directory: {directory}")
                 except Exception as e:
                     results['errors'].append(f"Cannot create directory {directory}: {str(e)}")
                     results['is_valid'] = False
-            elif not os.path.isdir(directory):
+            elif not is_dir:
                 results['errors'].append(f"Path exists but is not a directory: {directory}")
                 results['is_valid'] = False
-            else:
-                # Check write permissions
+            elif not os.access(directory, os.W_OK):
+                # access() checks the real rather than the effective UID, so
+                # confirm a refusal with an actual write before warning
                 test_file = os.path.join(directory, '.write_test')
                 try:
                     with open(test_file, 'w') as f:
@@ -372,7 +622,8 @@ class EnvironmentValidator:
         
         # Check files
         for filepath in required_files:
-            if not os.path.exists(filepath):
+            exists, _ = _path_state(filepath, listings)
+            if not exists:
                 if filepath == './.env':
                     results['errors'].append(f"Missing required file: {filepath}")
                     results['is_valid'] = False
@@ -385,6 +636,8 @@ class EnvironmentValidator:
 class ScheduleValidator:
     """Validates schedule configuration"""
     
+    __slots__ = ()
+    
     @staticmethod
     def validate_schedule(schedule_config: Dict) -> Dict[str, any]:
         """
@@ -433,12 +686,12 @@ class ScheduleValidator:
                 try:
                     if isinstance(time_range['start'], str):
                         # Parse string time
-                        start_time = datetime.strptime(time_range['start'], '%H:%M').time()
+                        start_time = _parse_hh_mm(time_range['start'])
                     else:
                         start_time = time_range['start']
                     
                     if isinstance(time_range['end'], str):
-                        end_time = datetime.strptime(time_range['end'], '%H:%M').time()
+                        end_time = _parse_hh_mm(time_range['end'])
                     else:
                         end_time = time_range['end']
                     
@@ -454,9 +707,10 @@ class ScheduleValidator:
             if not isinstance(days, list):
                 results['errors'].append('Days must be a list')
                 results['is_valid'] = False
-            else:
+            elif not all(isinstance(day, int) for day in days) or not _VALID_DAYS.issuperset(days):
+                # Only walk the list for error messages when something is off
                 for day in days:
-                    if not isinstance(day, int) or day < 0 or day > 6:
+                    if not isinstance(day, int) or day not in _VALID_DAYS:
                         results['errors'].append(f"Invalid day value: {day}. Must be 0-6")
                         results['is_valid'] = False
             
@@ -474,6 +728,8 @@ class ScheduleValidator:
 class ConfigValidator:
     """Validates application configuration"""
     
+    __slots__ = ()
+    
     @staticmethod
     def validate_config(config_data: Dict) -> Dict[str, any]:
         """
@@ -522,10 +778,27 @@ class ConfigValidator:
 
 
 # Convenience functions
+@lru_cache(maxsize=1)
+def _default_validator() -> ContentValidator:
+    """
+    Shared ContentValidator, so its matchers are only built once
+    
+    Every convenience function uses this instance, so it must not be
+    mutated: calling add_blocked_words on it would change what all of them
+    block. To customise the word list, construct a ContentValidator of
+    your own instead.
+    """
+    return ContentValidator()
+
+
 def validate_tweet_content(content: str, max_length: int = 280) -> Dict[str, any]:
     """Convenience function to validate tweet content"""
-    validator = ContentValidator()
-    return validator.validate_tweet_content(content, max_length)
+    return _default_validator().validate_tweet_content(content, max_length)
+
+
+def validate_tweet_quick(content: str, max_length: int = 280) -> bool:
+    """Convenience function to check whether tweet content is valid"""
+    return _default_validator().validate_tweet_quick(content, max_length)
 
 
 def validate_environment() -> Dict[str, any]:
@@ -540,14 +813,12 @@ def validate_schedule(schedule_config: Dict) -> Dict[str, any]:
 
 def validate_hashtags(hashtags: List[str]) -> Dict[str, any]:
     """Convenience function to validate hashtags"""
-    validator = ContentValidator()
-    return validator.validate_hashtags(hashtags)
+    return _default_validator().validate_hashtags(hashtags)
 
 
 def is_profane_content(content: str) -> Dict[str, any]:
     """Convenience function to check for profanity"""
-    validator = ContentValidator()
-    return validator.is_profane_content(content)
+    return _default_validator().is_profane_content(content)
 
 
 # Test function